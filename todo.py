@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import os
+import re
 import sqlite3
+import atexit
 import click
+import contextlib
 from datetime import datetime
-import dateparser
 import logging
 from rich.console import Console
 from rich.table import Table, Column
@@ -12,30 +14,139 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal, Grid
 from textual.widgets import Header, Footer, DataTable, Button, Select, Input, Label, Static
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual import events
 from textual.screen import Screen
 from textual.message import Message
-import humanize
 
 # Initialize rich console
 console = Console()
 
 # Set up logging
-log_file = os.path.expanduser("~/.todo.log")
-debug_file = os.path.expanduser("~/.todo.debug")
+LOG_FILE = os.path.expanduser("~/.todo.log")
+DEBUG_FILE = os.path.expanduser("~/.todo.debug")
 
+# Size of the debug file write buffer
+DEBUG_BUFFER_SIZE = 128 * 1024
 
-def debug_print(message):
-    """Write debug message to both log and debug files."""
-    with open(debug_file, 'a') as f:
-        f.write(f"{datetime.now().strftime('%H:%M:%S')} - {message}\n")
-    logging.info(message)
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that lets a large write buffer absorb log bursts.
 
-# Clean up old files if they exist
-for file in [log_file, debug_file]:
-    if os.path.exists(file):
-        os.remove(file)
+    The stock handler flushes after every record; this one only writes to
+    the buffered stream, which is flushed when full and on close (logging
+    closes handlers at interpreter exit).
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=DEBUG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+# Debug output is only written when TODOTERM_DEBUG is set
+DEBUG = bool(os.environ.get("TODOTERM_DEBUG"))
+
+# Debug logger writing to the debug file through a single open handler;
+# messages are only formatted when a record is actually emitted
+log = logging.getLogger("todo")
+log.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+log.propagate = False
+_debug_handler = BufferedFileHandler(DEBUG_FILE, delay=True)
+_debug_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(message)s", datefmt="%H:%M:%S"))
+log.addHandler(_debug_handler)
+
+# Database location and shared connection (opened by _get_conn)
+DB_PATH = os.path.expanduser("~/.todo.db")
+_CONN = None
+
+# Database schema, applied in one script when user_version is behind
+SCHEMA_VERSION = 2
+SCHEMA = f'''
+    BEGIN;
+
+    -- Create tasks table
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        deadline DATETIME,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        status TEXT DEFAULT 'todo'
+    );
+
+    -- Create tags table
+    CREATE TABLE IF NOT EXISTS tags (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL
+    );
+
+    -- Create task_tags junction table
+    CREATE TABLE IF NOT EXISTS task_tags (
+        task_id INTEGER,
+        tag_id INTEGER,
+        FOREIGN KEY (task_id) REFERENCES tasks (id),
+        FOREIGN KEY (tag_id) REFERENCES tags (id),
+        PRIMARY KEY (task_id, tag_id)
+    );
+
+    -- Index the task-list sort order and filters
+    CREATE INDEX IF NOT EXISTS idx_tasks_created
+    ON tasks (created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_tasks_status
+    ON tasks (status);
+    CREATE INDEX IF NOT EXISTS idx_task_tags_tag
+    ON task_tags (tag_id);
+
+    PRAGMA user_version = {SCHEMA_VERSION};
+
+    COMMIT;
+'''
+
+# Statements reused on the hot paths; keeping them as module constants lets
+# sqlite3's per-connection statement cache hand back the compiled version.
+SQL_GET_TASKS = '''
+    SELECT t.id, t.title, t.description, t.deadline, t.status,
+           (SELECT GROUP_CONCAT('#' || tag.name, ', ')
+            FROM task_tags tt
+            JOIN tags tag ON tt.tag_id = tag.id
+            WHERE tt.task_id = t.id) as tags
+    FROM tasks t
+    WHERE (:status IS NULL OR t.status = :status)
+      AND (:tag IS NULL OR EXISTS (
+            SELECT 1
+            FROM task_tags tt
+            JOIN tags tag ON tt.tag_id = tag.id
+            WHERE tt.task_id = t.id AND tag.name = :tag))
+    ORDER BY t.created_at DESC
+'''
+SQL_INSERT_TASK = '''
+    INSERT INTO tasks (title, description, deadline, status)
+    VALUES (?, ?, ?, 'todo')
+'''
+SQL_INSERT_TAG = 'INSERT OR IGNORE INTO tags (name) VALUES (?)'
+SQL_LINK_TAGS = '''
+    INSERT INTO task_tags (task_id, tag_id)
+    SELECT ?, id FROM tags WHERE name IN ({})
+'''
+SQL_DELETE_TASK_TAGS = 'DELETE FROM task_tags WHERE task_id = ?'
+SQL_DELETE_TASK = 'DELETE FROM tasks WHERE id = ?'
+SQL_UPDATE_STATUS = 'UPDATE tasks SET status = ? WHERE id = ?'
+SQL_GET_STATUS = 'SELECT status FROM tasks WHERE id = ?'
+SQL_GET_USED_TAGS = '''
+    SELECT DISTINCT t.name
+    FROM tags t
+    JOIN task_tags tt ON t.id = tt.tag_id
+    ORDER BY t.name
+'''
 
 # Task statuses
 STATUSES = {
@@ -45,91 +156,92 @@ STATUSES = {
 }
 
 
+def _get_conn():
+    """Return the shared database connection, opening it on first use."""
+    global _CONN
+    if _CONN is None:
+        # Autocommit at the driver level; writes open their own transactions
+        _CONN = sqlite3.connect(DB_PATH, check_same_thread=False,
+                                cached_statements=256, isolation_level=None)
+        # journal_mode persists in the file; the rest are per-connection.
+        # auto_vacuum only takes effect when the database file is created.
+        _CONN.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CONN.execute("PRAGMA temp_store=MEMORY")
+        _CONN.execute("PRAGMA mmap_size=268435456")
+        _CONN.execute("PRAGMA cache_size=-64000")
+        _CONN.execute("PRAGMA foreign_keys=ON")
+        # Refresh planner statistics for the queries this run made
+        atexit.register(_CONN.execute, "PRAGMA optimize")
+    return _CONN
+
+
 def init_db():
     """Initialize the SQLite database and create tables if they don't exist."""
-    db_path = os.path.expanduser("~/.todo.db")
-    conn = sqlite3.connect(db_path)
+    conn = _get_conn()
+
+    # Skip the DDL entirely when the file already has the current schema
     c = conn.cursor()
+    c.execute('PRAGMA user_version')
+    if c.fetchone()[0] < SCHEMA_VERSION:
+        c.executescript(SCHEMA)
 
-    # Create tasks table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            deadline DATETIME,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            status TEXT DEFAULT 'todo'
-        )
-    ''')
+    # Hand pages freed by deletes back to the filesystem. executescript
+    # steps the pragma to completion, execute() would free a single page
+    c.executescript('PRAGMA incremental_vacuum;')
 
-    # Create tags table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL
-        )
-    ''')
-
-    # Create task_tags junction table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS task_tags (
-            task_id INTEGER,
-            tag_id INTEGER,
-            FOREIGN KEY (task_id) REFERENCES tasks (id),
-            FOREIGN KEY (tag_id) REFERENCES tags (id),
-            PRIMARY KEY (task_id, tag_id)
-        )
-    ''')
 
-    conn.commit()
-    conn.close()
+@contextlib.contextmanager
+def transaction():
+    """Run the enclosed writes in a single explicit transaction."""
+    conn = _get_conn()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
 
 
-def get_tasks():
-    """Get all tasks from the database."""
-    conn = sqlite3.connect(os.path.expanduser("~/.todo.db"))
-    c = conn.cursor()
+def get_tasks(status=None, tag=None):
+    """Get tasks from the database, optionally only those with a status or tag."""
+    c = _get_conn().cursor()
 
-    c.execute('''
-        SELECT t.id, t.title, t.description, t.deadline, t.status,
-               GROUP_CONCAT(DISTINCT tag.name) as tags
-        FROM tasks t
-        LEFT JOIN task_tags tt ON t.id = tt.task_id
-        LEFT JOIN tags tag ON tt.tag_id = tag.id
-        GROUP BY t.id, t.title, t.description, t.deadline, t.status
-        ORDER BY t.created_at DESC
-    ''')
+    c.execute(SQL_GET_TASKS, {'status': status, 'tag': tag})
 
     tasks = c.fetchall()
-    conn.close()
     return tasks
 
 
+def get_used_tags():
+    """Get the names of all tags attached to at least one task."""
+    c = _get_conn().cursor()
+    c.execute(SQL_GET_USED_TAGS)
+    return [row[0] for row in c.fetchall()]
+
+
 def update_task_status(task_id, new_status):
     """Update the status of a task."""
-    debug_print(f"Updating task {task_id} status to {new_status}")
-    conn = sqlite3.connect(os.path.expanduser("~/.todo.db"))
-    c = conn.cursor()
+    log.debug("Updating task %s status to %s", task_id, new_status)
+    c = _get_conn().cursor()
     try:
-        c.execute('UPDATE tasks SET status = ? WHERE id = ?',
-                  (new_status, task_id))
-        conn.commit()
+        with transaction():
+            c.execute(SQL_UPDATE_STATUS, (new_status, task_id))
 
         # Verify the update
-        c.execute('SELECT status FROM tasks WHERE id = ?', (task_id,))
+        c.execute(SQL_GET_STATUS, (task_id,))
         result = c.fetchone()
         if result and result[0] == new_status:
-            debug_print(
-                f"Successfully updated task {task_id} status to {new_status}")
+            log.debug(
+                "Successfully updated task %s status to %s", task_id, new_status)
         else:
-            debug_print(
-                f"Failed to update task {task_id} status. Current status: {result[0] if result else 'not found'}")
+            log.debug(
+                "Failed to update task %s status. Current status: %s", task_id, result[0] if result else 'not found')
     except Exception as e:
-        debug_print(f"Error updating task status: {str(e)}")
+        log.debug("Error updating task status: %s", e)
         raise
-    finally:
-        conn.close()
 
 
 class RefreshMessage(Message):
@@ -144,18 +256,20 @@ class SearchMessage(Message):
         super().__init__()
 
 
-def format_deadline(deadline_str):
-    """Format deadline in a human-readable format."""
+def format_deadline(deadline_str, now=None):
+    """Format deadline in a human-readable format relative to now."""
     if not deadline_str:
         return ""
 
+    # Imported lazily so CLI runs that never show the table skip it
+    import humanize
     try:
         deadline = datetime.fromisoformat(deadline_str)
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
 
-        time_str = humanize.naturaltime(deadline)
         if deadline < now:
-            return f"[red]{time_str}[/]"
+            return f"[red]{humanize.naturaltime(deadline, when=now)}[/]"
         else:
             return humanize.naturaltime(deadline, when=now, future=True)
     except (ValueError, TypeError):
@@ -189,7 +303,7 @@ class FilterScreen(Screen):
     def __init__(self):
         super().__init__()
         self.title = "Filter Tasks"
-        debug_print("FilterScreen initialized")
+        log.debug("FilterScreen initialized")
 
     def compose(self) -> ComposeResult:
         """Create the filter UI."""
@@ -200,24 +314,15 @@ class FilterScreen(Screen):
                 for status in STATUSES.keys():
                     yield Button(STATUSES[status], id=f"filter-{status}")
 
-            # Get unique tags from database - improved query
-            conn = sqlite3.connect(os.path.expanduser("~/.todo.db"))
-            c = conn.cursor()
-            c.execute('''
-                SELECT DISTINCT t.name 
-                FROM tags t 
-                JOIN task_tags tt ON t.id = tt.tag_id 
-                ORDER BY t.name
-            ''')
-            tags = [row[0] for row in c.fetchall()]
-            conn.close()
-            debug_print(f"Found tags in database: {tags}")
+            # Get unique tags, cached by the app between database changes
+            tags = self.app.load_tags()
+            log.debug("Found tags: %s", tags)
 
             if tags:
                 yield Label("Filter by tags:")
                 with Grid(id="tag-grid"):
                     for tag in tags:
-                        debug_print(f"Creating button for tag: {tag}")
+                        log.debug("Creating button for tag: %s", tag)
                         yield Button(f"#{tag}", id=f"filter-tag-{tag}", variant="default")
             else:
                 yield Label("No tags available - add tasks with #tags to enable filtering")
@@ -301,6 +406,12 @@ class TodoApp(App):
         'done': 'green'
     }
 
+    # Rendered status cell for each status
+    STATUS_RENDER = {
+        status: f"[{color}]{STATUSES[status]}[/]"
+        for status, color in STATUS_COLORS.items()
+    }
+
     CSS = """
     #task-table {
         height: 1fr;
@@ -389,15 +500,83 @@ class TodoApp(App):
         self.filter_status = None
         self.filter_tag = None
         self.filter_search = None
+        self._row_task_ids = []
+        self._row_statuses = []
+        self._task_cache = {}
+        self._tag_list_cache = None
+
+    def load_tasks(self):
+        """Get the tasks matching the status and tag filters.
+
+        Results are cached per filter combination, so search keystrokes and
+        repeated filters are served without a query. The cache is columnar:
+        "id", "status", "search" (lowercased title, description and tags),
+        "deadline" (raw ISO string) and "row" (the rendered table cells), so
+        the search loop only touches the text it matches against.
+        """
+        key = (self.filter_status, self.filter_tag)
+        cols = self._task_cache.get(key)
+        if cols is None:
+            now = datetime.now()
+            status_render = self.STATUS_RENDER.get
+            cols = self._task_cache[key] = {
+                "id": [], "status": [], "search": [], "deadline": [],
+                "row": []}
+            for id_, title, desc, deadline, status, tags in get_tasks(*key):
+                cols["id"].append(id_)
+                cols["status"].append(status)
+                cols["search"].append(f"{title} {desc or ''} {tags or ''}".lower())
+                cols["deadline"].append(deadline)
+                cols["row"].append((
+                    title,
+                    desc or "",
+                    format_deadline(deadline, now),
+                    tags or "",
+                    status_render(status, status)
+                ))
+        return cols
+
+    def refresh_deadlines(self) -> None:
+        """Re-format cached deadlines and patch the cells whose text changed."""
+        now = datetime.now()
+        for cols in self._task_cache.values():
+            rows = cols["row"]
+            for i, deadline in enumerate(cols["deadline"]):
+                if deadline:
+                    deadline_str = format_deadline(deadline, now)
+                    if deadline_str != rows[i][2]:
+                        rows[i] = rows[i][:2] + (deadline_str,) + rows[i][3:]
+
+        # Update the visible rows for the current filters; reload if a status
+        # change or delete has invalidated the cache since the last refresh
+        cols = self.load_tasks()
+        deadlines = {id_: row[2] for id_, row in zip(cols["id"], cols["row"])}
+        # Query the main screen, which stays below any open form or filter
+        table = self.screen_stack[0].query_one("#task-table", DataTable)
+        for row, task_id in enumerate(self._row_task_ids):
+            deadline_str = deadlines.get(task_id, "")
+            if table.get_cell_at(Coordinate(row, 2)) != deadline_str:
+                table.update_cell_at(Coordinate(row, 2), deadline_str)
+
+    def load_tags(self):
+        """Get the tags in use, reading the database only when not cached."""
+        if self._tag_list_cache is None:
+            self._tag_list_cache = get_used_tags()
+        return self._tag_list_cache
+
+    def invalidate_cache(self) -> None:
+        """Drop cached task data after the database changes."""
+        self._task_cache = {}
+        self._tag_list_cache = None
 
     def on_refresh_message(self, message: RefreshMessage) -> None:
         """Handle refresh message."""
-        debug_print("Received refresh message")
+        log.debug("Received refresh message")
         self.refresh_table()
 
     def on_search_message(self, message: SearchMessage) -> None:
         """Handle search message."""
-        debug_print(f"Received search message: {message.search_text}")
+        log.debug("Received search message: %s", message.search_text)
         self.filter_search = message.search_text
         self.set_timer(0.1, self.refresh_table)
 
@@ -425,6 +604,12 @@ class TodoApp(App):
         # Add rows
         self.refresh_table()
 
+        # Keep relative deadlines ("in 5 minutes") current
+        self.set_interval(60, self.refresh_deadlines)
+
+        # Load dateparser in the background so the first new task is quick
+        self.run_worker(warm_date_parser, thread=True)
+
         # Set focus to the table
         self.set_focus(table)
 
@@ -461,10 +646,10 @@ class TodoApp(App):
     def show_status_menu(self) -> None:
         """Show a menu to change task status."""
         if self.current_task_id is None:
-            debug_print("No task selected for status change")
+            log.debug("No task selected for status change")
             return
 
-        debug_print(f"Showing status menu for task {self.current_task_id}")
+        log.debug("Showing status menu for task %s", self.current_task_id)
 
         status_select = Select(
             options=[
@@ -477,85 +662,61 @@ class TodoApp(App):
         )
 
         async def handle_status_change(event: Select.Changed) -> None:
-            debug_print("Status change handler triggered")
+            log.debug("Status change handler triggered")
             status = event.value
-            debug_print(f"Status selected: {status}")
+            log.debug("Status selected: %s", status)
 
             try:
                 update_task_status(self.current_task_id, status)
-                debug_print(
-                    f"Updated task {self.current_task_id} status to {status}")
+                self.invalidate_cache()
+                log.debug(
+                    "Updated task %s status to %s", self.current_task_id, status)
                 self.refresh_table()
-                debug_print("Table refreshed")
+                log.debug("Table refreshed")
             except Exception as e:
-                debug_print(f"Error updating status: {str(e)}")
+                log.debug("Error updating status: %s", e)
             finally:
                 status_select.remove()
-                debug_print("Status menu removed")
+                log.debug("Status menu removed")
 
         status_select.changed = handle_status_change
         self.mount(status_select)
-        debug_print("Status menu mounted")
+        log.debug("Status menu mounted")
 
     def refresh_table(self) -> None:
         """Refresh the task table."""
-        debug_print("Refreshing table")
-        debug_print(
-            f"Current filters - status: {self.filter_status}, tag: {self.filter_tag}, search: {self.filter_search}")
+        log.debug("Refreshing table")
+        log.debug(
+            "Current filters - status: %s, tag: %s, search: %s", self.filter_status, self.filter_tag, self.filter_search)
         table = self.query_one("#task-table", DataTable)
 
-        # Clear both rows and columns
-        table.clear()
-        table.columns.clear()
-        debug_print("Cleared table rows and columns")
-
-        # Add columns
-        table.add_columns(
-            "Title", "Description", "Deadline", "Tags", "Status"
-        )
-        debug_print("Added fresh columns")
+        # Defer repaints until every row is in place
+        with self.batch_update():
+            # Clear the rows; columns are set up once in on_mount
+            table.clear()
+            log.debug("Cleared table rows")
 
-        tasks = get_tasks()
-        debug_print(f"Got {len(tasks)} tasks from database")
+            cols = self.load_tasks()
+            ids = cols["id"]
+            rows = cols["row"]
+            log.debug("Got %s tasks", len(ids))
 
-        for task in tasks:
-            id_, title, desc, deadline, status, tags = task
-
-            # Apply filters
-            if self.filter_status and status != self.filter_status:
-                debug_print(f"Skipping task {id_} due to status filter")
-                continue
-
-            if self.filter_tag:
-                task_tags = tags.split(',') if tags else []
-                debug_print(
-                    f"Checking tag filter {self.filter_tag} against task tags: {task_tags}")
-                if not task_tags or self.filter_tag not in task_tags:
-                    debug_print(f"Skipping task {id_} due to tag filter")
-                    continue
-
-            # Apply search filter (fuzzy match on title, description and tags)
+            # Apply search filter (fuzzy match on title, description and
+            # tags), matching any term with one scan of each row's text
             if self.filter_search:
-                search_text = (title + " " + (desc or "") +
-                               " " + (tags or "")).lower()
-                if not any(term in search_text for term in self.filter_search.split()):
-                    debug_print(f"Skipping task {id_} due to search filter")
-                    continue
-
-            deadline_str = format_deadline(deadline) if deadline else ""
-            tags_str = tags if tags else ""
-            tags_str = ", ".join(
-                f"#{tag}" for tag in tags_str.split(",")) if tags_str else ""
-            color = self.STATUS_COLORS.get(status, 'white')
-            status_text = f"[{color}]{STATUSES[status]}[/]"
-
-            table.add_row(
-                title,
-                desc or "",
-                deadline_str,
-                tags_str,
-                status_text
-            )
+                terms = self.filter_search.split()
+                search = re.compile("|".join(map(re.escape, terms))).search
+                indices = [i for i, text in enumerate(cols["search"])
+                           if search(text)]
+                log.debug("Search matched %s of %s tasks", len(indices), len(ids))
+            else:
+                indices = range(len(ids))
+
+            add_row = table.add_row
+            for i in indices:
+                add_row(*rows[i], key=str(ids[i]))
+            self._row_task_ids = [ids[i] for i in indices]
+            self._row_statuses = [cols["status"][i] for i in indices]
 
         # Update footer to show active filters
         filter_msg = []
@@ -573,7 +734,7 @@ class TodoApp(App):
 
     def action_new_task(self) -> None:
         """Handle new task creation."""
-        debug_print("Pushing new task screen")
+        log.debug("Pushing new task screen")
         self.push_screen(NewTaskScreen())
 
     def show_message(self, message: str, is_error: bool = False) -> None:
@@ -589,16 +750,24 @@ class TodoApp(App):
     def action_delete_task(self) -> None:
         """Handle task deletion."""
         table = self.query_one("#task-table", DataTable)
-        if table.cursor_row is not None:
+        if table.cursor_row is not None and self._row_task_ids:
             current_row = table.cursor_row
-            # Get the task data from get_tasks() using the row index
-            tasks = get_tasks()
-            task_id = tasks[current_row][0]  # First element is ID
-            delete_task(task_id)
+            task_id = self._row_task_ids[current_row]
+            deleted = delete_task(task_id)
+            self.invalidate_cache()
+            if not deleted:
+                # The table is out of sync with the database; rebuild it
+                self.refresh_table()
+                self.show_message(f"Task {task_id} not found", is_error=True)
+                return
             self.show_message(f"Task {task_id} deleted successfully!")
-            self.refresh_table()
 
-            # After refresh, set cursor to the same position or last item
+            # Drop just the deleted row instead of rebuilding the table
+            table.remove_row(str(task_id))
+            del self._row_task_ids[current_row]
+            del self._row_statuses[current_row]
+
+            # Set cursor to the same position or last item
             total_rows = len(table.rows)
             if total_rows > 0:
                 # If we deleted the last row, move cursor to the new last row
@@ -616,17 +785,14 @@ class TodoApp(App):
 
     def action_change_status(self) -> None:
         """Handle status change with ENTER key."""
-        debug_print("action_change_status triggered")
+        log.debug("action_change_status triggered")
         table = self.query_one("#task-table", DataTable)
-        if table.cursor_row is not None:
+        if table.cursor_row is not None and self._row_task_ids:
             current_row = table.cursor_row
-            debug_print(f"Selected row: {current_row}")
-            # Get the task data from get_tasks() using the row index
-            tasks = get_tasks()
-            task = tasks[current_row]
-            task_id = task[0]  # First element is ID
-            current_status = task[4]  # Fifth element is status
-            debug_print(f"Current status: {current_status}")
+            log.debug("Selected row: %s", current_row)
+            task_id = self._row_task_ids[current_row]
+            current_status = self._row_statuses[current_row]
+            log.debug("Current status: %s", current_status)
 
             # Define status cycle
             status_cycle = {
@@ -637,31 +803,37 @@ class TodoApp(App):
 
             # Get next status
             new_status = status_cycle.get(current_status, 'todo')
-            debug_print(
-                f"Changing status from {current_status} to {new_status}")
+            log.debug(
+                "Changing status from %s to %s", current_status, new_status)
 
             # Update status
             update_task_status(task_id, new_status)
-            self.refresh_table()
+            self.invalidate_cache()
+            status_text = self.STATUS_RENDER[new_status]
+
+            if self.filter_status:
+                # The row may no longer match the filter, so rebuild
+                self.refresh_table()
 
-            # Restore cursor position
-            table = self.query_one("#task-table", DataTable)
-            table.move_cursor(row=current_row)
-            table.scroll_to(0, current_row)
-            debug_print(f"Restored cursor to row {current_row}")
+                # Restore cursor position
+                table.move_cursor(row=current_row)
+                table.scroll_to(0, current_row)
+                log.debug("Restored cursor to row %s", current_row)
+            else:
+                # Only the status cell changed
+                table.update_cell_at(Coordinate(current_row, 4), status_text)
+                self._row_statuses[current_row] = new_status
 
-            color = self.STATUS_COLORS.get(new_status, 'white')
-            self.show_message(
-                f"Changed status to [{color}]{STATUSES[new_status]}[/]")
+            self.show_message(f"Changed status to {status_text}")
         else:
-            debug_print("No row selected")
+            log.debug("No row selected")
 
 
 class NewTaskScreen(Screen):
     def __init__(self):
         super().__init__()
         self.title = "New Task"
-        debug_print("NewTaskScreen initialized")
+        log.debug("NewTaskScreen initialized")
 
     def compose(self) -> ComposeResult:
         with Container(id="form-container"):
@@ -675,49 +847,50 @@ class NewTaskScreen(Screen):
             yield Static(id="status")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        debug_print(f"Button pressed: {event.button.id}")
+        log.debug("Button pressed: %s", event.button.id)
         status = self.query_one("#status", Static)
 
         if event.button.id == "add":
             try:
-                debug_print("Getting input values...")
+                log.debug("Getting input values...")
                 task_input = self.query_one("#task", Input)
                 desc_input = self.query_one("#description", Input)
 
                 command = task_input.value.strip()
                 description = desc_input.value.strip()
 
-                debug_print(f"Command received: '{command}'")
-                debug_print(f"Description received: '{description}'")
+                log.debug("Command received: '%s'", command)
+                log.debug("Description received: '%s'", description)
 
                 if command:
-                    debug_print("Parsing command...")
+                    log.debug("Parsing command...")
                     title, deadline, tags = parse_command(command)
-                    debug_print(
-                        f"Parsed: title='{title}', deadline='{deadline}', tags='{tags}'")
+                    log.debug(
+                        "Parsed: title='%s', deadline='%s', tags='%s'", title, deadline, tags)
                     try:
-                        debug_print("Adding task to database...")
+                        log.debug("Adding task to database...")
                         add_task(title, description, deadline, tags)
-                        debug_print("Task added successfully!")
+                        self.app.invalidate_cache()
+                        log.debug("Task added successfully!")
                         status.update("Task added successfully!")
-                        debug_print("Popping screen...")
+                        log.debug("Popping screen...")
                         self.app.pop_screen()
-                        debug_print("Refreshing table...")
+                        log.debug("Refreshing table...")
                         self.app.refresh_table()
                     except Exception as e:
-                        debug_print(f"Error adding task: {str(e)}")
+                        log.debug("Error adding task: %s", e)
                         status.update(f"Error: {str(e)}")
                 else:
-                    debug_print("No command provided (empty string)")
+                    log.debug("No command provided (empty string)")
                     status.update("Please enter task details")
             except Exception as e:
-                debug_print(f"Error in button handler: {str(e)}")
-                debug_print(f"Error type: {type(e)}")
+                log.debug("Error in button handler: %s", e)
+                log.debug("Error type: %s", type(e))
                 import traceback
-                debug_print(f"Traceback: {traceback.format_exc()}")
+                log.debug("Traceback: %s", traceback.format_exc())
                 status.update(f"Error: {str(e)}")
         elif event.button.id == "cancel":
-            debug_print("Cancel button pressed")
+            log.debug("Cancel button pressed")
             self.app.pop_screen()
 
     def on_key(self, event: events.Key) -> None:
@@ -725,129 +898,160 @@ class NewTaskScreen(Screen):
             self.app.pop_screen()
 
 
+# Deadlines are English phrases about upcoming dates; pinning the language
+# skips dateparser's per-call language detection
+DATEPARSER_LANGUAGES = ['en']
+DATEPARSER_SETTINGS = {'PREFER_DATES_FROM': 'future'}
+
+# Words that introduce a deadline, e.g. "due next week"
+DEADLINE_KEYWORDS = frozenset(('for', 'due', 'by', 'on'))
+
+# Words a date phrase can start with; other positions are not tried. Tokens
+# starting with a digit ("12 march", "3rd of june") are always tried.
+# Phrases starting with any other word are deliberately not found, e.g.
+# "an hour from now" or "a week from friday".
+DATE_START_WORDS = DEADLINE_KEYWORDS | frozenset((
+    'today', 'tonight', 'tomorrow', 'yesterday', 'next', 'this', 'last',
+    'in', 'end', 'within', 'after',
+    'at', 'noon', 'midnight', 'morning', 'afternoon', 'evening', 'night',
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday',
+    'sunday', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun',
+    'january', 'february', 'march', 'april', 'may', 'june', 'july',
+    'august', 'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct',
+    'nov', 'dec',
+))
+
+# Phrases already known not to be dates
+_NON_DATES = set()
+_NON_DATES_MAX = 512
+
+
+def parse_date(date_str):
+    """Parse a date phrase, returning None if it is not a date.
+
+    Successful parses depend on the current time, so only failures are
+    remembered.
+    """
+    if date_str in _NON_DATES:
+        return None
+    # dateparser is slow to import; only load it once a date is needed
+    import dateparser
+    parsed = dateparser.parse(date_str, languages=DATEPARSER_LANGUAGES,
+                              settings=DATEPARSER_SETTINGS)
+    if parsed is None:
+        if len(_NON_DATES) >= _NON_DATES_MAX:
+            _NON_DATES.clear()
+        _NON_DATES.add(date_str)
+    return parsed
+
+
+def warm_date_parser():
+    """Load dateparser and its English data ahead of the first real parse."""
+    parse_date("today")
+
+
 def parse_command(command):
     """Parse the command string to extract title, deadline, and tags."""
-    debug_print(f"Parsing command: {command}")
-    # Split the command into parts
-    parts = command.split()
-    debug_print(f"Split parts: {parts}")
-
-    # Extract tags (starting with #)
-    tags = [part[1:] for part in parts if part.startswith('#')]
-    parts = [part for part in parts if not part.startswith('#')]
-    debug_print(f"After tag extraction - parts: {parts}, tags: {tags}")
+    log.debug("Parsing command: %s", command)
+
+    # Split the command into tags (starting with #) and words in one pass,
+    # lowercasing each word once for the keyword checks below
+    tags = []
+    parts = []
+    words = []
+    for part in command.split():
+        if part.startswith('#'):
+            tags.append(part[1:])
+        else:
+            parts.append(part)
+            words.append(part.lower())
+    log.debug("After tag extraction - parts: %s, tags: %s", parts, tags)
 
     # Try to find a deadline with keywords first
     deadline = None
-    deadline_keywords = ['for', 'due', 'by', 'on']
-    for i, part in enumerate(parts):
-        if part.lower() in deadline_keywords and i + 1 < len(parts):
-            date_str = ' '.join(parts[i+1:])
-            debug_print(f"Trying to parse date with keyword: {date_str}")
-            deadline = dateparser.parse(date_str)
-            if deadline:
-                debug_print(f"Found deadline with keyword: {deadline}")
-                parts = parts[:i]
-                break
-
-    # If no deadline found with keywords, try parsing from the end with increasing chunks
+    if not DEADLINE_KEYWORDS.isdisjoint(words):
+        for i, word in enumerate(words):
+            if word in DEADLINE_KEYWORDS and i + 1 < len(parts):
+                date_str = ' '.join(parts[i+1:])
+                log.debug("Trying to parse date with keyword: %s", date_str)
+                deadline = parse_date(date_str)
+                if deadline:
+                    log.debug("Found deadline with keyword: %s", deadline)
+                    parts = parts[:i]
+                    break
+
+    # If no deadline found with keywords, look for a date phrase in the text
     if not deadline:
-        # Try parsing from largest possible chunk to smallest
-        best_deadline = None
-        best_i = len(parts)
-        best_chunk_size = 0
-
-        # Start from a minimum of 2 words (to catch phrases like "next week")
-        for chunk_size in range(min(5, len(parts)), 1, -1):
-            for i in range(len(parts) - chunk_size + 1):
+        # Scan left to right, only from words that can start a date, and
+        # take the longest chunk that parses there, so the leftmost and
+        # longest date phrase wins. Chunks are at least 2 words (to catch
+        # phrases like "next week") and at most 5.
+        for i, word in enumerate(words):
+            if word not in DATE_START_WORDS and not word[0].isdigit():
+                continue
+
+            for chunk_size in range(min(5, len(parts) - i), 1, -1):
                 date_str = ' '.join(parts[i:i + chunk_size])
-                debug_print(f"Trying to parse date chunk: {date_str}")
-                parsed_date = dateparser.parse(date_str)
-                if parsed_date:
-                    debug_print(f"Found valid date in chunk: {parsed_date}")
-                    # Keep track of the earliest (leftmost) and largest valid date phrase
-                    if i <= best_i:
-                        best_deadline = parsed_date
-                        best_i = i
-                        best_chunk_size = chunk_size
-                        debug_print(
-                            f"New best date found: {best_deadline} at position {best_i}")
-
-        if best_deadline:
-            deadline = best_deadline
-            parts = parts[:best_i] + parts[best_i + best_chunk_size:]
-            debug_print(f"Using best found deadline: {deadline}")
+                log.debug("Trying to parse date chunk: %s", date_str)
+                deadline = parse_date(date_str)
+                if deadline:
+                    log.debug("Found deadline %s at position %s", deadline, i)
+                    parts = parts[:i] + parts[i + chunk_size:]
+                    break
+
+            if deadline:
+                break
 
     # The rest is the title
     title = ' '.join(parts)
-    debug_print(
-        f"Final result - title: '{title}', deadline: {deadline}, tags: {tags}")
+    log.debug(
+        "Final result - title: '%s', deadline: %s, tags: %s", title, deadline, tags)
 
     return title, deadline, tags
 
 
 def add_task(title, description, deadline=None, tags=None):
     """Add a new task to the database."""
-    debug_print(
-        f"Adding task: title='{title}', description='{description}', deadline='{deadline}', tags='{tags}'")
-    conn = sqlite3.connect(os.path.expanduser("~/.todo.db"))
-    c = conn.cursor()
+    log.debug(
+        "Adding task: title='%s', description='%s', deadline='%s', tags='%s'", title, description, deadline, tags)
+    c = _get_conn().cursor()
 
     try:
-        # Insert task
-        c.execute('''
-            INSERT INTO tasks (title, description, deadline, status)
-            VALUES (?, ?, ?, 'todo')
-        ''', (title, description, deadline))
-
-        task_id = c.lastrowid
-        debug_print(f"Task inserted with ID: {task_id}")
-
-        # Handle tags
-        if tags:
-            for tag in tags:
-                # Insert or get tag
-                c.execute('INSERT OR IGNORE INTO tags (name) VALUES (?)', (tag,))
-                c.execute('SELECT id FROM tags WHERE name = ?', (tag,))
-                tag_id = c.fetchone()[0]
-                debug_print(f"Tag '{tag}' has ID: {tag_id}")
-
-                # Link tag to task
-                c.execute('INSERT INTO task_tags (task_id, tag_id) VALUES (?, ?)',
-                          (task_id, tag_id))
-                debug_print(f"Linked tag {tag_id} to task {task_id}")
-
-        conn.commit()
-        conn.close()
-        debug_print("Database connection closed")
-
-        # Verify the task was added
-        conn = sqlite3.connect(os.path.expanduser("~/.todo.db"))
-        c = conn.cursor()
-        c.execute('SELECT id FROM tasks WHERE id = ?', (task_id,))
-        if not c.fetchone():
-            debug_print("Task verification failed")
-            raise Exception("Failed to add task")
-        debug_print("Task verification successful")
-        conn.close()
+        with transaction():
+            # Insert task
+            c.execute(SQL_INSERT_TASK, (title, description, deadline))
+            if c.rowcount != 1:
+                log.debug("Task insert failed")
+                raise Exception("Failed to add task")
+
+            task_id = c.lastrowid
+            log.debug("Task inserted with ID: %s", task_id)
+
+            # Handle tags
+            if tags:
+                # Insert missing tags, then link them all in one statement
+                c.executemany(SQL_INSERT_TAG, [(tag,) for tag in tags])
+                c.execute(SQL_LINK_TAGS.format(",".join("?" * len(tags))),
+                          (task_id, *tags))
+                log.debug("Linked %s tags to task %s", c.rowcount, task_id)
     except Exception as e:
-        debug_print(f"Database error: {str(e)}")
-        conn.close()
+        log.debug("Database error: %s", e)
         raise Exception(f"Database error: {str(e)}")
 
 
 def delete_task(task_id):
-    """Delete a task and its associated tags from the database."""
-    conn = sqlite3.connect(os.path.expanduser("~/.todo.db"))
-    c = conn.cursor()
-    try:
+    """Delete a task and its associated tags from the database.
+
+    Returns True if the task existed and was deleted.
+    """
+    c = _get_conn().cursor()
+    with transaction():
         # Delete task tags first (due to foreign key constraint)
-        c.execute('DELETE FROM task_tags WHERE task_id = ?', (task_id,))
+        c.execute(SQL_DELETE_TASK_TAGS, (task_id,))
         # Delete the task
-        c.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
-        conn.commit()
-    finally:
-        conn.close()
+        c.execute(SQL_DELETE_TASK, (task_id,))
+    return c.rowcount == 1
 
 
 @click.command()
@@ -855,6 +1059,12 @@ def delete_task(task_id):
 @click.option('-d', '--description', help='Task description')
 def main(command, description):
     """A simple terminal-based todo application."""
+    # Clean up old files only on request; otherwise the logs just append
+    if os.environ.get("TODOTERM_RESET_LOGS"):
+        for file in [LOG_FILE, DEBUG_FILE]:
+            if os.path.exists(file):
+                os.remove(file)
+
     # Initialize database
     init_db()
 